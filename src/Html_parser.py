@@ -13,8 +13,123 @@
 
 # Импортируем необходимые библиотеки
 import pandas as pd  # Для работы с табличными данными и Excel
-from bs4 import BeautifulSoup  # Для парсинга HTML
+from bs4 import BeautifulSoup, SoupStrainer  # Для парсинга HTML
 import os  # Для работы с файловой системой
+import re  # Для нормализации пробелов в тексте ячеек
+import sys  # Для вывода сводки одной записью в stdout
+import hashlib  # Для ключей кэша результатов парсинга
+import mmap  # Для чтения больших файлов без копирования в память
+import threading  # Для блокировки общего кэша результатов парсинга
+from concurrent.futures import ProcessPoolExecutor  # Для параллельного разбора таблиц
+from collections import OrderedDict  # Для LRU-кэша результатов парсинга
+from io import BytesIO, StringIO  # Для разбора HTML из памяти
+
+# Предпочитаем быстрый парсер lxml (C-расширение); если он не установлен,
+# используем встроенный в Python html.parser
+try:
+    from lxml import etree  # Для потокового разбора HTML средствами libxml2
+    _BS4_PARSER = 'lxml'
+    # Текст ячейки с нормализованными пробелами, вычисляется внутри libxml2.
+    # smart_strings=False: результат не держит ссылку на элемент дерева,
+    # иначе очистка уже обработанных строк не освобождала бы память
+    _cell_text = etree.XPath('normalize-space(.)', smart_strings=False)
+    # Ошибки libxml2, после которых потоковый разбор может молча оборваться
+    _ENCODING_ERRORS = frozenset((
+        etree.ErrorTypes.ERR_INVALID_ENCODING,
+        etree.ErrorTypes.ERR_UNKNOWN_ENCODING,
+        etree.ErrorTypes.ERR_UNSUPPORTED_ENCODING,
+    ))
+
+    class _HtmlEncodingError(etree.ParserError):
+        """Байты HTML недопустимы в указанной кодировке (запасной путь не поможет)."""
+except ImportError:
+    etree = None
+    _BS4_PARSER = 'html.parser'
+
+# pyarrow нужен только для parse_html_table_arrow() и не является обязательным
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+# Для ключей кэша предпочитаем быстрый xxhash; без него используем blake2b
+try:
+    from xxhash import xxh64_intdigest as _fast_hash
+except ImportError:
+    def _fast_hash(data: bytes) -> int:
+        return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little')
+
+# Пробельные символы в смысле XPath normalize-space(): пробел, табуляция, CR, LF
+_XML_SPACE = re.compile(r'[ \t\r\n]+')
+
+# Фильтр для BeautifulSoup: строим дерево только для элементов <table>,
+# остальная часть документа при разборе пропускается
+_ONLY_TABLES = SoupStrainer('table')
+
+# Файлы больше этого размера main() отображает в память (mmap), а не читает целиком
+_MMAP_THRESHOLD = 1024 * 1024
+
+
+def _open_source(html, encoding: str):
+    """Возвращает файловый объект с байтами HTML для lxml.etree.iterparse."""
+    if isinstance(html, mmap.mmap):
+        # libxml2 читает страницы отображённого файла напрямую, без полной копии
+        html.seek(0)
+        return html
+    return BytesIO(html if isinstance(html, bytes) else html.encode(encoding))
+
+
+def _decode_source(html, encoding: str) -> str:
+    """Декодирует HTML в str для BeautifulSoup (запасной путь)."""
+    if isinstance(html, mmap.mmap):
+        html = html[:]
+    if isinstance(html, bytes):
+        html = html.decode(encoding)
+    return html
+
+
+# Кэш результатов парсинга: ключ — тип и хэш исходного HTML и параметры вызова.
+# Доступ защищён блокировкой: функции парсинга могут вызываться из разных потоков
+_CACHE_MAXSIZE = 32
+_parse_cache: OrderedDict = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _cache_key(kind: str, html, *params):
+    """Возвращает ключ кэша для HTML в виде str/bytes или None, если кэшировать нельзя.
+
+    Тип входа входит в ключ: одинаковые str и его UTF-8 байты при другой
+    encoding разбираются по-разному и не должны делить запись кэша.
+    """
+    is_text = isinstance(html, str)
+    if is_text:
+        html = html.encode('utf-8', 'surrogatepass')
+    elif not isinstance(html, bytes):
+        return None
+    return (kind, is_text, _fast_hash(html), len(html), *params)
+
+
+def _cache_get(key):
+    """Достаёт результат из кэша и помечает его как недавно использованный."""
+    if key is None:
+        return None
+    with _cache_lock:
+        value = _parse_cache.get(key)
+        if value is not None:
+            _parse_cache.move_to_end(key)
+        return value
+
+
+def _cache_put(key, value) -> None:
+    """Сохраняет результат в кэш, вытесняя самые старые записи."""
+    if key is None:
+        return
+    with _cache_lock:
+        _parse_cache[key] = value
+        _parse_cache.move_to_end(key)
+        while len(_parse_cache) > _CACHE_MAXSIZE:
+            _parse_cache.popitem(last=False)
+
 
 def parse_html_tables(source: str):
     """
@@ -24,10 +139,14 @@ def parse_html_tables(source: str):
     всех таблиц из HTML-документа. Подходит для простых случаев, когда
     таблицы имеют стандартную структуру.
 
+    Результат для HTML текста кэшируется (по хэшу содержимого), поэтому
+    повторный вызов с тем же текстом не разбирает документ заново.
+    Пути к файлам и URL не кэшируются: их содержимое может измениться.
+
     Parameters
     ----------
-    source : str
-        HTML текст, путь к локальному файлу или URL-адрес.
+    source : str | os.PathLike | file-like
+        HTML текст, путь к локальному файлу, URL-адрес или файловый объект.
 
     Returns
     -------
@@ -35,9 +154,18 @@ def parse_html_tables(source: str):
         Список DataFrame'ов для каждой найденной таблицы.
         Если таблицы не найдены, возвращает пустой список.
     """
+    # Кэшируем только HTML текст; пути (str/Path), URL и файловые объекты
+    # передаём в pandas как есть и без кэша
+    key = _cache_key('tables', source) if isinstance(source, str) and '<' in source else None
+    cached = _cache_get(key)
+    if cached is not None:
+        # Отдаём копии, чтобы изменения у вызывающего не портили кэш
+        return [table.copy() for table in cached]
+
     try:
         # Используем pandas для автоматического парсинга всех таблиц
-        tables = pd.read_html(source)
+        tables = pd.read_html(StringIO(source)) if key is not None else pd.read_html(source)
+        _cache_put(key, [table.copy() for table in tables])
         return tables
     except ValueError:
         # Если таблицы не найдены, pandas выбросит ValueError
@@ -45,57 +173,396 @@ def parse_html_tables(source: str):
         return []
 
 
-def parse_html_table(html: str, index: int = 0):
+def _check_encoding_errors(events, encoding: str) -> None:
+    """
+    Выбрасывает etree.ParserError, если libxml2 встретил байты, недопустимые в кодировке.
+
+    На таких байтах iterparse не выбрасывает исключение, а просто прекращает
+    разбор, и результат оказался бы неполным без всякого предупреждения.
+    """
+    for entry in events.error_log:
+        if entry.type in _ENCODING_ERRORS:
+            raise _HtmlEncodingError(
+                f"HTML содержит байты, недопустимые в кодировке {encoding} (строка {entry.line})"
+            )
+
+
+def _iter_events(events, encoding: str):
+    """Перебирает события iterparse, превращая ошибки кодировки в _HtmlEncodingError."""
+    try:
+        yield from events
+    except etree.LxmlError:
+        # Недопустимые байты в самом начале документа libxml2 сообщает
+        # как общую синтаксическую ошибку — уточняем её по журналу ошибок
+        _check_encoding_errors(events, encoding)
+        raise
+
+
+def _iter_table_rows_lxml(html, index: int, encoding: str):
+    """
+    Потоково извлекает строки таблицы с помощью lxml.etree.iterparse.
+
+    Документ не строится целиком: каждая строка <tr> отдаётся сразу после
+    закрывающего тега и затем удаляется из дерева, поэтому потребление
+    памяти пропорционально размеру строки, а не всего документа.
+    Возвращает (через StopIteration) True, если таблица была найдена.
+    Выбрасывает etree.ParserError, если байты не соответствуют кодировке.
+    """
+    # Байты передаём в libxml2 как есть — декодирование выполняется в C
+    source = _open_source(html, encoding)
+    events = etree.iterparse(source, events=('start', 'end'), tag=('table', 'tr'),
+                             html=True, encoding=encoding)
+
+    table_count = 0
+    # Стек индексов открытых таблиц (для корректной обработки вложенных таблиц)
+    open_tables: list[int] = []
+    found = False
+
+    for event, elem in _iter_events(events, encoding):
+        if elem.tag == 'table':
+            if event == 'start':
+                open_tables.append(table_count)
+                table_count += 1
+                if open_tables[-1] == index:
+                    found = True
+                continue
+
+            if open_tables.pop() == index:
+                # Нужная таблица закрыта — дальше документ можно не читать
+                _check_encoding_errors(events, encoding)
+                return True
+            if not open_tables:
+                elem.clear()
+            continue
+
+        if event != 'end':
+            continue
+
+        if index in open_tables:
+            cells = [_cell_text(cell) for cell in elem.iterchildren('td', 'th')]
+            if cells:
+                yield cells
+
+        # Строки вложенных таблиц освобождаем вместе со строкой внешней таблицы,
+        # чтобы не потерять текст её ячеек
+        if len(open_tables) <= 1:
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+    _check_encoding_errors(events, encoding)
+    return found
+
+
+def _normalize_space(text: str) -> str:
+    """Повторяет XPath normalize-space(): схлопывает пробелы и обрезает края."""
+    return _XML_SPACE.sub(' ', text).strip(' \t\r\n')
+
+
+def _iter_table_rows_bs4(html, index: int, encoding: str):
+    """
+    Извлекает строки таблицы с помощью BeautifulSoup.
+
+    Используется как запасной вариант, когда lxml не установлен
+    или не смог разобрать документ.
+    Возвращает (через StopIteration) True, если таблица была найдена.
+    """
+    html = _decode_source(html, encoding)
+
+    # Создаем объект BeautifulSoup для парсинга HTML (только таблицы)
+    soup = BeautifulSoup(html, _BS4_PARSER, parse_only=_ONLY_TABLES)
+    
+    # Находим все элементы <table> в HTML
+    tables = soup.find_all('table')
+    if index >= len(tables):
+        return False
+    
+    # Проходим по всем строкам таблицы (<tr>)
+    for tr in tables[index].find_all('tr'):
+        # Извлекаем текст из всех ячеек (как <td>, так и <th>) и нормализуем
+        # пробелы так же, как normalize-space() на пути через lxml
+        cells = [_normalize_space(td.get_text()) for td in tr.find_all(['td', 'th'])]
+        
+        # Отдаём строку только если в ней есть ячейки
+        if cells:
+            yield cells
+    
+    return True
+
+
+def iter_html_table(html, index: int = 0, encoding: str = 'utf-8'):
+    """
+    Построчно парсит одну HTML таблицу.
+
+    Генератор: строки отдаются по мере разбора документа, поэтому большие
+    HTML-файлы не приходится целиком загружать в виде DOM-дерева.
+    Использует lxml.etree.iterparse; если lxml не установлен или документ
+    не удалось разобрать, используется BeautifulSoup. Если ошибка разбора
+    возникла уже после того, как часть строк была отдана, исключение
+    пробрасывается вызывающему.
+
+    Parameters
+    ----------
+    html : str | bytes | mmap.mmap
+        HTML разметка, содержащая как минимум одну таблицу.
+    index : int, optional
+        Индекс таблицы для парсинга (по умолчанию 0 - первая таблица).
+    encoding : str, optional
+        Кодировка HTML, переданного в виде bytes (по умолчанию UTF-8).
+
+    Yields
+    ------
+    list[str]
+        Строковые значения ячеек очередной строки таблицы.
+
+    Raises
+    ------
+    lxml.etree.ParserError
+        Если байты HTML недопустимы в кодировке encoding (без lxml —
+        UnicodeDecodeError при декодировании для BeautifulSoup).
+    """
+    if etree is not None:
+        rows = _iter_table_rows_lxml(html, index, encoding)
+        emitted = False
+        while True:
+            try:
+                cells = next(rows)
+            except StopIteration as stop:
+                found = stop.value
+                break
+            except _HtmlEncodingError:
+                # BeautifulSoup не декодирует эти байты лучше; сохраняем тип ошибки
+                raise
+            except (etree.LxmlError, ValueError):
+                # Часть строк уже отдана — повторный разбор через BeautifulSoup
+                # выдал бы их вызывающему второй раз
+                if emitted:
+                    raise
+                # Сильно повреждённый HTML — пробуем более терпимый BeautifulSoup
+                found = yield from _iter_table_rows_bs4(html, index, encoding)
+                break
+            emitted = True
+            yield cells
+    else:
+        found = yield from _iter_table_rows_bs4(html, index, encoding)
+
+    # Проверяем, найдены ли таблицы и существует ли указанный индекс
+    if not found:
+        print(f"⚠️ Таблица с индексом {index} не найдена")
+
+
+def parse_html_table(html, index: int = 0, encoding: str = 'utf-8'):
     """
-    Парсит одну HTML таблицу с помощью BeautifulSoup.
+    Парсит одну HTML таблицу.
     
     Эта функция предоставляет более детальный контроль над процессом парсинга
     и позволяет извлекать данные из таблиц со сложной структурой.
-    Использует BeautifulSoup для ручного обхода DOM-дерева.
+    Собирает в список строки, которые отдаёт iter_html_table().
+    Результат для str/bytes кэшируется по хэшу содержимого, поэтому
+    повторный вызов с тем же HTML не разбирает документ заново.
 
     Parameters
     ----------
-    html : str
+    html : str | bytes | mmap.mmap
         HTML разметка, содержащая как минимум одну таблицу.
     index : int, optional
         Индекс таблицы для парсинга (по умолчанию 0 - первая таблица).
+    encoding : str, optional
+        Кодировка HTML, переданного в виде bytes (по умолчанию UTF-8).
 
     Returns
     -------
     list[list[str]]
         Распарсенная таблица в виде списка строк с ячейками.
         Каждая строка представлена списком строковых значений ячеек.
+
+    Raises
+    ------
+    lxml.etree.ParserError
+        Если байты HTML недопустимы в кодировке encoding (без lxml —
+        UnicodeDecodeError при декодировании для BeautifulSoup).
     """
-    # Создаем объект BeautifulSoup для парсинга HTML
-    soup = BeautifulSoup(html, 'html.parser')
-    
-    # Находим все элементы <table> в HTML
-    tables = soup.find_all('table')
-    
-    # Проверяем, найдены ли таблицы и существует ли указанный индекс
-    if not tables or index >= len(tables):
-        print(f"⚠️ Таблица с индексом {index} не найдена")
-        return []
-    
-    # Выбираем нужную таблицу по индексу
-    table = tables[index]
+    key = _cache_key('table', html, index, encoding)
+    cached = _cache_get(key)
+    if cached is not None:
+        return [list(row) for row in cached]
 
-    # Список для хранения всех строк таблицы
-    rows: list[list[str]] = []
-    
-    # Проходим по всем строкам таблицы (<tr>)
-    for tr in table.find_all('tr'):
-        # Извлекаем текст из всех ячеек (как <td>, так и <th>)
-        # strip=True удаляет лишние пробелы в начале и конце
-        cells = [td.get_text(strip=True) for td in tr.find_all(['td', 'th'])]
-        
-        # Добавляем строку только если в ней есть ячейки
-        if cells:
-            rows.append(cells)
-    
+    rows = list(iter_html_table(html, index, encoding))
+    # Пустой результат не кэшируем, чтобы предупреждение выводилось каждый раз
+    if rows:
+        _cache_put(key, tuple(tuple(row) for row in rows))
     return rows
 
 
+def parse_html_table_arrow(html, index: int = 0, encoding: str = 'utf-8'):
+    """
+    Парсит одну HTML таблицу в pyarrow.Table.
+
+    В отличие от parse_html_table(), строки не хранятся в виде вложенных
+    списков Python: значения раскладываются по столбцам прямо во время
+    потокового разбора и упаковываются pyarrow в непрерывные буферы.
+    Это экономит память и ускоряет дальнейшую выгрузку, например
+    через table.to_pandas(self_destruct=True).
+
+    Parameters
+    ----------
+    html : str | bytes | mmap.mmap
+        HTML разметка, содержащая как минимум одну таблицу.
+    index : int, optional
+        Индекс таблицы для парсинга (по умолчанию 0 - первая таблица).
+    encoding : str, optional
+        Кодировка HTML, переданного в виде bytes (по умолчанию UTF-8).
+
+    Returns
+    -------
+    pyarrow.Table
+        Таблица со строковыми столбцами c0, c1, ...; недостающие ячейки
+        в коротких строках заполняются null.
+    """
+    if pa is None:
+        raise ImportError("Для parse_html_table_arrow() нужен pyarrow: pip install pyarrow")
+
+    columns: list[list] = []
+    row_count = 0
+    for cells in iter_html_table(html, index, encoding):
+        # Новый столбец дополняем null для уже прочитанных строк
+        while len(columns) < len(cells):
+            columns.append([None] * row_count)
+        for column, value in zip(columns, cells):
+            column.append(value)
+        for column in columns[len(cells):]:
+            column.append(None)
+        row_count += 1
+
+    return pa.table({f'c{i}': pa.array(column, type=pa.string()) for i, column in enumerate(columns)})
+
+
+def split_html_tables(html, encoding: str = 'utf-8'):
+    """
+    Разбивает HTML-документ на отдельные таблицы верхнего уровня.
+
+    Вложенные таблицы остаются внутри разметки своей внешней таблицы.
+    Используется, чтобы передавать в pandas.read_html() каждую таблицу
+    отдельно: один вызов read_html() на документ с N таблицами работает
+    заметно медленнее, чем N вызовов на небольших фрагментах.
+
+    Parameters
+    ----------
+    html : str | bytes | mmap.mmap
+        HTML разметка документа.
+    encoding : str, optional
+        Кодировка HTML, переданного в виде bytes (по умолчанию UTF-8).
+
+    Returns
+    -------
+    list[str]
+        HTML-код каждой найденной таблицы (<table>...</table>).
+
+    Raises
+    ------
+    lxml.etree.ParserError
+        Если байты HTML недопустимы в кодировке encoding (без lxml —
+        UnicodeDecodeError при декодировании для BeautifulSoup).
+    """
+    if etree is not None:
+        try:
+            return _split_tables_lxml(html, encoding)
+        except _HtmlEncodingError:
+            # BeautifulSoup не декодирует эти байты лучше; сохраняем тип ошибки
+            raise
+        except (etree.LxmlError, ValueError):
+            # Сильно повреждённый HTML — пробуем более терпимый BeautifulSoup
+            pass
+
+    html = _decode_source(html, encoding)
+    soup = BeautifulSoup(html, _BS4_PARSER, parse_only=_ONLY_TABLES)
+    # Благодаря SoupStrainer таблицы верхнего уровня — прямые потомки soup
+    return [str(table) for table in soup.find_all('table', recursive=False)]
+
+
+def _split_tables_lxml(html, encoding: str):
+    """Потоково выделяет таблицы верхнего уровня с помощью lxml.etree.iterparse."""
+    source = _open_source(html, encoding)
+    events = etree.iterparse(source, events=('start', 'end'), tag='table',
+                             html=True, encoding=encoding)
+
+    tables: list[str] = []
+    depth = 0
+    for event, elem in _iter_events(events, encoding):
+        if event == 'start':
+            depth += 1
+            continue
+
+        depth -= 1
+        if depth:
+            continue
+
+        tables.append(etree.tostring(elem, encoding='unicode', method='html', with_tail=False))
+        # Освобождаем уже обработанную часть документа
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+    _check_encoding_errors(events, encoding)
+    return tables
+
+
+def _read_table_html(table_html: str):
+    """Читает HTML-код одной таблицы в список DataFrame'ов (для пула процессов)."""
+    # Вложенные таблицы pandas вернёт отдельными DataFrame'ами
+    return pd.read_html(StringIO(table_html))
+
+
+def read_split_tables(table_htmls, max_workers=None):
+    """
+    Параллельно преобразует HTML-код таблиц в DataFrame'ы.
+
+    Каждая таблица разбирается pandas.read_html() независимо от остальных,
+    поэтому работа распределяется по процессам через ProcessPoolExecutor.
+    Для одной таблицы пул не создаётся.
+
+    Parameters
+    ----------
+    table_htmls : list[str]
+        HTML-код таблиц, например результат split_html_tables().
+    max_workers : int, optional
+        Максимальное число процессов (по умолчанию — число ядер CPU).
+
+    Returns
+    -------
+    list[pd.DataFrame]
+        DataFrame'ы в порядке следования таблиц в документе.
+    """
+    if len(table_htmls) < 2:
+        chunks = map(_read_table_html, table_htmls)
+    else:
+        workers = min(max_workers or os.cpu_count() or 1, len(table_htmls))
+        # Отдаём таблицы пачками, чтобы сократить накладные расходы на IPC
+        chunksize = max(1, len(table_htmls) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = list(executor.map(_read_table_html, table_htmls, chunksize=chunksize))
+
+    tables = []
+    for dataframes in chunks:
+        tables.extend(dataframes)
+    return tables
+
+
+def _read_table_htmls(html_file: str):
+    """
+    Читает HTML-файл и выделяет из него HTML-код отдельных таблиц.
+
+    Файл читается как байты: lxml сам декодирует их из UTF-8, поэтому
+    лишняя копия документа в виде str не создаётся. Большие файлы
+    отображаются в память через mmap и разбираются прямо из кэша страниц.
+    """
+    with open(html_file, 'rb') as file:
+        if os.fstat(file.fileno()).st_size <= _MMAP_THRESHOLD:
+            return split_html_tables(file.read())
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return split_html_tables(mapped)
+
+
 def main():
     """
    
@@ -104,7 +571,7 @@ def main():
     1. Определяет путь к файлу test.html
     2. Проверяет существование файла
     3. Читает HTML-контент
-    4. Парсит таблицы двумя способами (BeautifulSoup и pandas)
+    4. Парсит таблицы с помощью pandas и выводит начало первой таблицы
     5. Сохраняет результаты в Excel-файл
     """
     # Получаем абсолютный путь к директории, где находится сам скрипт
@@ -122,41 +589,47 @@ def main():
         return
     
     try:
-        # Открываем HTML-файл для чтения с кодировкой UTF-8
-        # Это обеспечивает корректное отображение русских символов
-        with open(html_file, 'r', encoding='utf-8') as file:
-            html_content = file.read()
-
-        # Парсим таблицу с помощью BeautifulSoup (первый способ)
-        print("🔍 Парсинг таблицы с помощью BeautifulSoup...")
-        result = parse_html_table(html_content)
-        
-        if result:
-            print(f"✅ Найдено {len(result)} строк в таблице")
-            # Выводим первые несколько строк для проверки
-            for i, row in enumerate(result[:3]):
-                print(f"   Строка {i+1}: {row}")
-        else:
-            print("❌ Таблицы не найдены в HTML-файле.")
+        # Разбираем весь документ только один раз и передаём pandas
+        # уже выделенный HTML-код отдельных таблиц
+        table_htmls = _read_table_htmls(html_file)
 
-        # Парсинг с помощью pandas (второй способ)
-        print("\n🔍 Парсинг таблиц с помощью pandas...")
-        tables = pd.read_html(html_file)
+        print("🔍 Парсинг таблиц с помощью pandas...")
+        # Каждую таблицу передаём в pandas отдельно (параллельно) — так быстрее,
+        # чем разбирать весь документ одним вызовом read_html()
+        tables = read_split_tables(table_htmls)
 
         if tables:
             print(f"✅ Найдено {len(tables)} таблиц")
+
+            # Предпросмотр первой таблицы берём из готового DataFrame,
+            # чтобы не разбирать HTML ещё раз
+            first_table = tables[0]
+            print(f"   Столбцы первой таблицы: {list(first_table.columns)}")
+            for i, row in enumerate(first_table.head(3).values.tolist()):
+                print(f"   Строка {i+1}: {row}")
             
             # Формируем путь для сохранения Excel-файла в папке data
             output_excel_path = os.path.join(data_dir, "all_tables2.xlsx")
             
             # Создаем Excel-файл с несколькими листами (по одному на таблицу)
-            with pd.ExcelWriter(output_excel_path, engine="openpyxl") as writer:
+            # xlsxwriter пишет быстрее и экономнее openpyxl. Режим constant_memory
+            # не используем: pandas записывает ячейки по столбцам, а в этом режиме
+            # xlsxwriter принимает только построчную запись и теряет данные
+            with pd.ExcelWriter(
+                output_excel_path,
+                engine="xlsxwriter",
+                engine_kwargs={"options": {"strings_to_urls": False}},
+            ) as writer:
+                # Сводку по таблицам копим и выводим одним вызовом после цикла,
+                # чтобы не делать по системному вызову записи на каждую таблицу
+                summary: list[str] = []
                 for i, table in enumerate(tables):
                     # Сохраняем каждую таблицу на отдельный лист
                     # sheet_name=f"Table_{i+1}" - именуем листы как Table_1, Table_2, etc.
                     # index=False - не сохраняем индексы строк
                     table.to_excel(writer, sheet_name=f"Table_{i+1}", index=False)
-                    print(f"   Таблица {i+1}: {table.shape[0]} строк, {table.shape[1]} столбцов")
+                    summary.append(f"   Таблица {i+1}: {table.shape[0]} строк, {table.shape[1]} столбцов")
+            sys.stdout.write("\n".join(summary) + "\n")
             
             print(f"✅ Файл Excel успешно сохранён: {output_excel_path}")
         else:
@@ -3,6 +3,7 @@
 
 Использование из консоли:
     python -m src.txt_to_html path/to/input.txt [-o path/to/output.html] [--title "Мой заголовок"]
+    python -m src.txt_to_html path/to/folder [--title "Мой заголовок"]
 
 Если входной файл содержит полный HTML-документ (<html> ...), содержимое будет сохранено как есть.
 Если файл содержит фрагмент HTML (например, только <table>), он будет обёрнут в минимальный HTML-шаблон.
@@ -11,64 +12,107 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import html
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 
 def read_text_file(file_path: Path) -> str:
     """Читает текстовый файл, пробуя несколько типичных кодировок.
 
-    Сначала пробуем UTF-8, затем CP1251 (актуально для Windows), затем ISO-8859-1 как последний шанс.
+    Файл читается с диска один раз, затем байты по очереди декодируются:
+    UTF-8 (с BOM или без), CP1251 (актуально для Windows), ISO-8859-1 как последний шанс.
+    Переводы строк приводятся к "\n", как при чтении в текстовом режиме.
     Возвращает содержимое файла как строку.
     """
-    encodings_to_try = ("utf-8", "cp1251", "iso-8859-1")
-    last_error: Optional[Exception] = None
+    data = file_path.read_bytes()
+    # utf-8-sig декодирует и обычный UTF-8, но вдобавок отбрасывает BOM
+    encodings_to_try = ("utf-8-sig", "cp1251", "iso-8859-1")
+    last_error: Optional[UnicodeDecodeError] = None
     for enc in encodings_to_try:
         try:
-            return file_path.read_text(encoding=enc)
-        except Exception as exc:  # noqa: BLE001 - осознанно логируем последнюю ошибку
+            text = data.decode(enc)
+        except UnicodeDecodeError as exc:
             last_error = exc
             continue
+        return text.replace("\r\n", "\n").replace("\r", "\n")
     if last_error:
         raise last_error
     return ""
 
 
+# Признаки полного документа ищем только в начале текста (после ведущих пробелов и BOM)
+_FULL_HTML_MARKER = re.compile(r"<html|<!doctype html", re.IGNORECASE)
+_FIRST_CONTENT_CHAR = re.compile(r"[^\s\ufeff]")
+_FULL_HTML_SCAN_LIMIT = 4096
+
+
 def looks_like_full_html(document: str) -> bool:
-    """Грубая проверка, является ли текст полноценным HTML-документом."""
-    lowered = document.strip().lower()
-    return ("<html" in lowered) or ("<!doctype html" in lowered)
+    """Грубая проверка, является ли текст полноценным HTML-документом.
+
+    Ведущие пробельные символы и BOM пропускаются, затем просматриваются только следующие 4 КБ:
+    <html> или <!doctype html> стоят в начале документа, поэтому копировать и переводить
+    в нижний регистр весь текст не нужно.
+    """
+    first = _FIRST_CONTENT_CHAR.search(document)
+    if first is None:
+        return False
+    start = first.start()
+    return _FULL_HTML_MARKER.search(document, start, start + _FULL_HTML_SCAN_LIMIT) is not None
+
+
+# Неизменные части HTML-каркаса для фрагментов; меняется только заголовок
+_WRAPPER_HEAD_PREFIX = (
+    "<!doctype html>\n"
+    "<html lang=\"ru\">\n"
+    "<head>\n"
+    "    <meta charset=\"utf-8\">\n"
+    "    <title>"
+)
+_WRAPPER_HEAD_SUFFIX = (
+    "</title>\n"
+    "    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\">\n"
+    "    <style>body{margin:16px;font-family:system-ui,-apple-system,Segoe UI,Roboto,Ubuntu,Cantarell,Noto Sans,sans-serif}</style>\n"
+    "</head>\n"
+    "<body>\n"
+)
+_WRAPPER_TAIL = (
+    "\n"
+    "</body>\n"
+    "</html>\n"
+)
+
+
+@lru_cache(maxsize=128)
+def _render_wrapper_head(title: str) -> str:
+    """Возвращает начало HTML-каркаса с экранированным заголовком (кэшируется по заголовку)."""
+    return _WRAPPER_HEAD_PREFIX + html.escape(title) + _WRAPPER_HEAD_SUFFIX
 
 
 def ensure_html_document(html_fragment_or_document: str, title: str) -> str:
     """Возвращает полноценный HTML-документ.
 
     Если вход уже содержит <html> или <!doctype html>, возвращаем как есть.
-    Иначе оборачиваем во внешний каркас с <head> и <meta charset>.
+    Иначе оборачиваем во внешний каркас с <head> и <meta charset>; заголовок экранируется.
     """
     if looks_like_full_html(html_fragment_or_document):
         return html_fragment_or_document
 
-    return (
-        "<!doctype html>\n"
-        "<html lang=\"ru\">\n"
-        "<head>\n"
-        "    <meta charset=\"utf-8\">\n"
-        f"    <title>{title}</title>\n"
-        "    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\">\n"
-        "    <style>body{margin:16px;font-family:system-ui,-apple-system,Segoe UI,Roboto,Ubuntu,Cantarell,Noto Sans,sans-serif}</style>\n"
-        "</head>\n"
-        "<body>\n"
-        f"{html_fragment_or_document}\n"
-        "</body>\n"
-        "</html>\n"
-    )
+    return _render_wrapper_head(title) + html_fragment_or_document + _WRAPPER_TAIL
 
 
 def write_html_file(content: str, output_path: Path) -> None:
-    """Сохраняет HTML содержимое в файл в UTF-8."""
+    """Сохраняет HTML содержимое в файл в UTF-8.
+
+    Текст кодируется один раз и записывается как байты, без построчной обработки переводов строк.
+    """
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(content, encoding="utf-8", newline="\n")
+    output_path.write_bytes(content.encode("utf-8"))
 
 
 def infer_output_path(input_path: Path) -> Path:
@@ -96,6 +140,60 @@ def convert_txt_html_to_html(input_file: Path, output_file: Optional[Path] = Non
     return target_path
 
 
+async def convert_many(
+    input_files: Iterable[Path], title: Optional[str] = None, max_in_flight: int = 64
+) -> list[Path]:
+    """Конвертирует несколько .txt файлов конкурентно.
+
+    Каждый файл обрабатывается convert_txt_html_to_html() в отдельном потоке (asyncio.to_thread),
+    одновременно выполняется не более max_in_flight конвертаций.
+    Возвращает пути к созданным .html файлам в порядке входных файлов.
+    """
+    semaphore = asyncio.Semaphore(max_in_flight)
+
+    async def convert_one(input_file: Path) -> Path:
+        async with semaphore:
+            return await asyncio.to_thread(convert_txt_html_to_html, input_file, None, title)
+
+    return list(await asyncio.gather(*(convert_one(Path(path)) for path in input_files)))
+
+
+def _scan_txt_files(root: str) -> list[tuple[int, str]]:
+    """Рекурсивно собирает (размер, путь) всех .txt файлов, пропуская скрытые файлы и папки."""
+    found: list[tuple[int, str]] = []
+    pending = [root]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.lower().endswith(".txt") and entry.is_file():
+                    found.append((entry.stat().st_size, entry.path))
+    return found
+
+
+def convert_directory(input_dir: Path, title: Optional[str] = None, max_workers: Optional[int] = None) -> list[Path]:
+    """Конвертирует все .txt файлы в папке (рекурсивно) в .html рядом с ними.
+
+    Обход выполняется через os.scandir, конвертация — в пуле потоков.
+    Крупные файлы запускаются первыми, чтобы самый долгий файл не оказался в конце очереди.
+    Возвращает пути к созданным .html файлам.
+    """
+    if not input_dir.is_dir():
+        raise NotADirectoryError(f"Папка не найдена: {input_dir}")
+
+    files = sorted(_scan_txt_files(str(input_dir)), reverse=True)
+    workers = max_workers if max_workers else (os.cpu_count() or 1) * 2
+
+    def convert_one(item: tuple[int, str]) -> Path:
+        return convert_txt_html_to_html(Path(item[1]), title=title)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(convert_one, files))
+
+
 def build_arg_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="txt_to_html",
@@ -104,7 +202,9 @@ def build_arg_parser() -> argparse.ArgumentParser:
             "Если входной файл — фрагмент, он будет обёрнут в минимальный HTML-документ."
         ),
     )
-    parser.add_argument("input", nargs="?", type=str, help="Путь к входному .txt файлу", default=None)
+    parser.add_argument(
+        "input", nargs="?", type=str, help="Путь к входному .txt файлу или папке с .txt файлами", default=None
+    )
     parser.add_argument("-o", "--output", type=str, help="Путь к выходному .html файлу", default=None)
     parser.add_argument("--title", type=str, help="Заголовок HTML-документа (если нужно)", default=None)
     return parser
@@ -123,6 +223,12 @@ def main() -> None:
     output_path = Path(args.output) if args.output else None
 
     try:
+        if input_path.is_dir():
+            if output_path is not None:
+                raise ValueError("Параметр -o/--output не поддерживается при конвертации папки")
+            created_files = convert_directory(input_path, title=args.title)
+            print(f"Готово: сконвертировано файлов — {len(created_files)}")
+            return
         created = convert_txt_html_to_html(input_path, output_path, title=args.title)
         print(f"Готово: {created}")
     except Exception as exc:  # noqa: BLE001 - печатаем сообщение пользователю